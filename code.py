@@ -3,18 +3,21 @@
 # SPDX-License-Identifier: GPLv3
 
 # load included modules if we aren't installed on the root path
-if len(__file__.split("/")[:-1]) > 1:
-    lib_path = "/".join(__file__.split("/")[:-1]) + "/lib"
+if __file__.count("/") > 1:
+    lib_path = __file__.rsplit("/", 1)[0] + "/lib"
     try:
         import os
         os.stat(lib_path)
-    except:
+    except OSError:
         pass
     else:
         import sys
         sys.path.append(lib_path)
 
+from array import array
+import asyncio
 import atexit
+import bitmaptools
 import displayio
 import gc
 import math
@@ -23,7 +26,13 @@ import sys
 import supervisor
 from terminalio import FONT
 import time
-import json
+try:
+    import ujson as json
+except ImportError:
+    import json
+json.dumps(None)  # see adafruit/circuitpython#8728
+import struct
+import vectorio
 
 from adafruit_anchored_group import AnchoredGroup
 from adafruit_anchored_tilegrid import AnchoredTileGrid
@@ -54,16 +63,47 @@ CACHE_DIR = ".cache"
 SCREENSAVERS_CATEGORY = "Screensavers"
 
 APPLICATIONS_PATH = "applications.json"  # used for testing
-APPLICATIONS_URL = "https://raw.githubusercontent.com/relic-se/Fruit_Jam_Library/refs/heads/main/database/applications.json"
+APPLICATIONS_URL = "https://raw.githubusercontent.com/relic-se/Fruit_Jam_Library/refs/heads/main/database/applications.min.json"
 METADATA_URL = "https://raw.githubusercontent.com/{:s}/refs/heads/main/metadata.json"
 REPO_URL = "https://api.github.com/repos/{:s}"
 ICON_URL = "https://raw.githubusercontent.com/{:s}/{:s}/{:s}"
 RELEASE_URL = "https://api.github.com/repos/{:s}/releases/latest"
 BRANCH_DOWNLOAD_URL = "https://github.com/{:s}/archive/refs/heads/{:s}.zip"
 
+# optional personal access token from settings.toml to raise the GitHub API rate limit
+API_HOST = "https://api.github.com/"
+API_HEADERS = {"Accept": "application/vnd.github+json"}
+if (api_token := os.getenv("GITHUB_TOKEN")):
+    API_HEADERS["Authorization"] = "Bearer " + api_token
+
+# response fields used from the GitHub API
+REPOSITORY_FIELDS = ("name", "owner", "description", "default_branch")
+RELEASE_FIELDS = ("zipball_url", "assets")
+METADATA_FIELDS = ("title", "description", "icon")
+
+# application details which may be prebuilt into the database by database/build.py
+APPLICATION_FIELDS = ("full_name", "title", "description", "default_branch", "icon")
+
+INDEX_MAGIC = b"FJLI"  # binary applications index
+INDEX_VERSION = 2
+INDEX_NONE = 0xffff  # string length marking a missing field
+
 MAJOR_VERSION = int(os.uname().release.split(".")[0])
 VERSION_NAME = "CircuitPython {:d}.x".format(MAJOR_VERSION)
 
+DOWNLOAD_CHUNK_SIZE = 1024  # bytes read from the network at a time
+
+JSON_CACHE_SIZE = 32  # maximum number of parsed json files kept in memory
+JSON_CACHE_MIN_FREE = 32768  # bytes of free memory required to keep parsed json files
+
+STATUS_INTERVAL = 0.1  # minimum seconds between intermediate status updates
+
+# seconds between polling keyboard and mouse input, backing off while idle
+INPUT_INTERVAL_MIN = 1 / 60
+INPUT_INTERVAL_MAX = 1 / 5
+
+PREFETCH_IDLE = 2  # seconds without input before the next page is prefetched
+
 # prepare system
 
 fj = adafruit_fruitjam.FruitJam()  # setup peripherals and networking
@@ -139,23 +179,78 @@ def is_application_installed(name: str, category: str = None) -> bool:
 for dirname in (APPLICATIONS_DIR, SCREENSAVERS_DIR, CACHE_DIR):
     mkdir(get_path(dirname))
 
+CACHE_PATH = get_path(CACHE_DIR) + "/"  # prefix of cached files
+
 # file download + caching
 
-def _download_file(url: str, extension: str, name: str|None = None) -> str:
+def write_response(response, path: str) -> None:
+    # stream response body into a temporary file without buffering it in memory
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+    except:
+        # don't leave a partial file behind, the previous copy remains intact
+        if exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # replace the previous copy only once the download is complete
+    if exists(path):
+        os.remove(path)
+    os.rename(tmp_path, path)
+
+# cached files which have been checked for changes since boot
+_revalidated = set()
+
+def _download_file(url: str, extension: str, name: str|None = None, revalidate: bool = False) -> str:
     if not extension.startswith("."):
         extension = "." + extension
 
     if name is None:
-        name = url.split("/")[-1][:-len(extension)]
+        name = url[url.rfind("/") + 1:-len(extension)]
     elif name.endswith(extension):
         name = name[:-len(extension)]
-    path = get_path([CACHE_DIR, name + extension])
+    path = CACHE_PATH + name + extension
 
-    # download file if it doesn't already exist
-    if not exists(path):
+    # download file if it doesn't already exist, or check whether it has changed once per boot
+    cached = exists(path)
+    if cached and (not revalidate or path in _revalidated):
+        return path
+
+    # conditional requests answered with 304 don't count against the GitHub API rate limit
+    etag_path = path + ".etag"
+    headers = API_HEADERS.copy() if url.startswith(API_HOST) else {}
+    if revalidate and cached and exists(etag_path):
+        try:
+            with open(etag_path, "r") as f:
+                headers["If-None-Match"] = f.read()
+        except OSError:
+            pass
+
+    try:
         fj.network.connect()  # ensure we're connected to wifi
-        fj.network.wget(url, path)
-    # TODO: Cache duration
+        response = fj.network.fetch(url, headers=headers, timeout=10)
+        try:
+            if response.status_code == 200:
+                write_response(response, path)
+                if revalidate:
+                    if "etag" in response.headers:
+                        with open(etag_path, "w") as f:
+                            f.write(response.headers["etag"])
+                    elif exists(etag_path):
+                        os.remove(etag_path)
+            elif response.status_code != 304:
+                raise ValueError("{:d} response".format(response.status_code))
+        finally:
+            response.close()
+    except (OSError, RuntimeError, ValueError, HttpError):
+        # fall back to the stale copy while offline or rate limited
+        if not cached:
+            raise
+    if revalidate:
+        _revalidated.add(path)
     return path
 
 def download_image(url: str, name: str|None = None) -> str:
@@ -165,14 +260,114 @@ def download_image(url: str, name: str|None = None) -> str:
         name=name,
     )
 
-def download_json(url: str, name: str|None = None) -> str:
+def read_json_fields(path: str, fields: tuple) -> dict:
+    # parse only the requested top-level fields of a json object while streaming the file
+    quote, colon, comma = ord('"'), ord(":"), ord(",")
+    opening, closing = (ord("{"), ord("[")), (ord("}"), ord("]"))
+
+    data = {}
+    depth = 0
+    in_string = escaped = False
+    expect_key = False
+    key = None  # bytes of the top-level key being read
+    name = None  # top-level key of the most recent value
+    value = None  # bytes of a requested value being read
+
+    with open(path, "rb") as f:
+        while len(data) < len(fields):
+            buf = f.read(DOWNLOAD_CHUNK_SIZE)
+            if not buf:
+                raise ValueError("incomplete json object")
+            i, n = 0, len(buf)
+            while i < n:
+                if in_string:
+                    # skip ahead to the next quote or escape sequence
+                    if escaped:
+                        end = i + 1
+                        escaped = False
+                    else:
+                        end = buf.find(b'"', i)
+                        escape = buf.find(b"\\", i, end if end >= 0 else n)
+                        if escape >= 0:
+                            end = escape + 1
+                            escaped = True
+                        elif end >= 0:
+                            end += 1
+                            in_string = False
+                        else:
+                            end = n
+                    if key is not None:
+                        key += buf[i:end]
+                        if not in_string:
+                            name = str(key[:-1], "utf-8")
+                            key = None
+                    elif value is not None:
+                        value += buf[i:end]
+                    i = end
+                    continue
+
+                c = buf[i]
+                i += 1
+                if depth == 1 and (c == comma or c in closing):
+                    # end of a top-level value
+                    if value is not None:
+                        data[name] = json.loads(str(value, "utf-8"))
+                        value = None
+                    expect_key = True
+                elif depth == 1 and c == colon:
+                    expect_key = False
+                    if name in fields:
+                        value = bytearray()
+                    continue
+                elif c == quote:
+                    in_string = True
+                    if depth == 1 and expect_key:
+                        key = bytearray()
+                        continue
+                elif depth == 0 and c != opening[0] and c > 0x20:
+                    raise ValueError("json data is not an object")
+
+                if c in opening:
+                    depth += 1
+                    if depth == 1:
+                        expect_key = True
+                elif c in closing:
+                    depth -= 1
+                    if not depth:
+                        return data
+                if value is not None:
+                    value.append(c)
+    return data
+
+# recently parsed json data, ordered from least to most recently used
+_json_cache = {}
+_json_cache_order = []
+
+def download_json(url: str, name: str|None = None, fields: tuple|None = None) -> dict:
+    key = name if name is not None else url
+    if key in _json_cache:
+        _json_cache_order.remove(key)
+        _json_cache_order.append(key)
+        return _json_cache[key]
+
     path = _download_file(
         url=url,
         extension=".json",
         name=name,
+        revalidate=True,
     )
-    with open(path, "r") as f:
-        data = json.loads(f.read())
+    if fields is not None:
+        # only materialize the requested top-level fields
+        data = read_json_fields(path, fields)
+    else:
+        with open(path, "r") as f:
+            data = json.load(f)
+
+    # keep parsed data in memory while there's room for it
+    _json_cache[key] = data
+    _json_cache_order.append(key)
+    while _json_cache_order and (len(_json_cache_order) > JSON_CACHE_SIZE or gc.mem_free() < JSON_CACHE_MIN_FREE):
+        del _json_cache[_json_cache_order.pop(0)]
     return data
 
 def download_zip(url: str, name: str|None = None) -> str:
@@ -189,11 +384,16 @@ try:
 except ImportError:
     config = None
 
-bg_palette = displayio.Palette(1)
-bg_palette[0] = config.palette_bg if config is not None else 0x222222
+# fall back to default colors when config is missing or doesn't provide them
+PALETTE_BG = getattr(config, "palette_bg", 0x222222)
+PALETTE_FG = getattr(config, "palette_fg", 0xffffff)
+PALETTE_ARROW = getattr(config, "palette_arrow", 0x004abe)
+PALETTE_ACCENT = getattr(config, "palette_accent", 0x008800)
 
-fg_palette = displayio.Palette(1)
-fg_palette[0] = config.palette_fg if config is not None else 0xffffff
+# shared by solid shapes and category tabs, which select colors by index
+theme_palette = displayio.Palette(2)
+theme_palette[0] = PALETTE_BG
+theme_palette[1] = PALETTE_FG
 
 # setup display
 try:
@@ -202,24 +402,35 @@ except ValueError:  # invalid user config or no user config provided
     adafruit_fruitjam.peripherals.request_display_config(720, 400)  # default display size
 display = supervisor.runtime.display
 
+# defer display refreshes until all changes within the context have been made
+class RefreshBatch:
+
+    def __enter__(self):
+        self._auto_refresh = display.auto_refresh
+        display.auto_refresh = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        display.auto_refresh = self._auto_refresh
+
 # load images
 default_icon_bmp, default_icon_palette = adafruit_imageload.load("bitmaps/default_icon.bmp")
 default_icon_palette.make_transparent(0)
 
 installed_bmp, installed_palette = adafruit_imageload.load("bitmaps/installed.bmp")
 installed_palette.make_transparent(1)
-installed_palette[0] = config.palette_bg if config is not None else 0x222222
-installed_palette[2] = config.palette_fg if config is not None else 0xffffff
+installed_palette[0] = PALETTE_BG
+installed_palette[2] = PALETTE_FG
 
 left_bmp, left_palette = adafruit_imageload.load("bitmaps/arrow_left.bmp")
 left_palette.make_transparent(0)
 right_bmp, right_palette = adafruit_imageload.load("bitmaps/arrow_right.bmp")
 right_palette.make_transparent(0)
-left_palette[2] = right_palette[2] = (config.palette_arrow if config is not None else 0x004abe)
+left_palette[2] = right_palette[2] = PALETTE_ARROW
 
 exit_bmp, exit_palette = adafruit_imageload.load("bitmaps/exit.bmp")
 exit_palette.make_transparent(0)
-exit_palette[1] = config.palette_fg if config is not None else 0xffffff
+exit_palette[1] = PALETTE_FG
 
 # display constants
 SCALE = 2 if display.width > 360 else 1
@@ -236,10 +447,12 @@ HELP_MARGIN = 1
 
 MENU_HEIGHT = 24
 MENU_GAP = 8
+MENU_RADIUS = 10
 
 PAGE_COLUMNS = SCALE
 PAGE_ROWS = 3
 PAGE_SIZE = PAGE_COLUMNS * PAGE_ROWS
+GRID_POS = tuple((index % PAGE_COLUMNS, index // PAGE_COLUMNS) for index in range(PAGE_SIZE))
 
 ARROW_MARGIN = 2
 
@@ -260,12 +473,12 @@ BUTTON_PROPS = {
     "height": MENU_HEIGHT,
     "label_font": FONT,
     "style": Button.ROUNDRECT,
-    "fill_color": (config.palette_bg if config is not None else 0x222222),
-    "label_color": (config.palette_fg if config is not None else 0xffffff),
-    "outline_color": (config.palette_fg if config is not None else 0xffffff),
-    "selected_fill": (config.palette_fg if config is not None else 0xffffff),
-    "selected_label": (config.palette_bg if config is not None else 0x222222),
-    "selected_outline": (config.palette_fg if config is not None else 0xffffff),
+    "fill_color": PALETTE_BG,
+    "label_color": PALETTE_FG,
+    "outline_color": PALETTE_FG,
+    "selected_fill": PALETTE_FG,
+    "selected_label": PALETTE_BG,
+    "selected_outline": PALETTE_FG,
 }
 
 class ActionButton(Button):
@@ -306,11 +519,12 @@ class TileGridButton(Button):
 root_group = displayio.Group()
 display.root_group = root_group
 
-bg_tg = displayio.TileGrid(
-    bitmap=displayio.Bitmap(display.width, display.height, 1),
-    pixel_shader=bg_palette,
+bg_rect = vectorio.Rectangle(
+    pixel_shader=theme_palette,
+    width=display.width,
+    height=display.height,
 )
-root_group.append(bg_tg)
+root_group.append(bg_rect)
 
 # add title
 title_group = displayio.Group(scale=SCALE)
@@ -319,7 +533,7 @@ root_group.append(title_group)
 title_label = Label(
     font=FONT,
     text="Fruit Jam Library",
-    color=(config.palette_fg if config is not None else 0xffffff),
+    color=PALETTE_FG,
     anchor_point=(0.5, 0.5),
     anchored_position=(DISPLAY_WIDTH // 2, TITLE_HEIGHT // 2),
 )
@@ -329,17 +543,19 @@ title_group.append(title_label)
 status_group = displayio.Group()
 root_group.append(status_group)
 
-status_bg_tg = displayio.TileGrid(
-    bitmap=displayio.Bitmap(display.width, STATUS_HEIGHT, 1),
-    pixel_shader=fg_palette,
+status_bg_rect = vectorio.Rectangle(
+    pixel_shader=theme_palette,
+    width=display.width,
+    height=STATUS_HEIGHT,
     y=display.height - STATUS_HEIGHT,
+    color_index=1,
 )
-status_group.append(status_bg_tg)
+status_group.append(status_bg_rect)
 
 status_label = Label(
     font=FONT,
     text="Loading...",
-    color=(config.palette_bg if config is not None else 0x222222),
+    color=PALETTE_BG,
     anchor_point=(0, 0.5),
     anchored_position=(STATUS_PADDING, display.height - STATUS_HEIGHT // 2)
 )
@@ -348,7 +564,7 @@ status_group.append(status_label)
 page_label = Label(
     font=FONT,
     text="0/0",
-    color=(config.palette_bg if config is not None else 0x222222),
+    color=PALETTE_BG,
     anchor_point=(1, 0.5),
     anchored_position=(display.width - STATUS_PADDING, display.height - STATUS_HEIGHT // 2)
 )
@@ -358,16 +574,173 @@ status_group.append(page_label)
 help_label = Label(
     font=FONT,
     text="[Arrow]: Move [Enter]: Select [1-9]: Category",
-    color=(config.palette_fg if config is not None else 0xffffff),
+    color=PALETTE_FG,
     anchor_point=(0, 1.0),
     anchored_position=(STATUS_PADDING, display.height - STATUS_HEIGHT - HELP_MARGIN)
 )
 root_group.append(help_label)
 
-def log(msg: str) -> None:
-    status_label.text = msg
+def set_text(label: Label|TextBox, text: str) -> None:
+    # avoid the cost of laying out text which hasn't changed
+    if label.text != text:
+        label.text = text
+
+status_time = 0
+def log(msg: str, force: bool = True) -> None:
+    global status_time
     print(msg)
 
+    # avoid redrawing the status bar for rapid intermediate updates
+    now = time.monotonic()
+    if not force and now - status_time < STATUS_INTERVAL:
+        return
+    status_time = now
+
+    set_text(status_label, msg)
+    if not display.auto_refresh:
+        display.refresh()
+
+def write_index(path: str, data: dict) -> None:
+    # store database as length-prefixed utf-8 strings grouped by category
+    def write_string(f, value: str|None) -> None:
+        if value is None:
+            f.write(struct.pack("<H", INDEX_NONE))
+            return
+        value = value.encode("utf-8")
+        f.write(struct.pack("<H", len(value)))
+        f.write(value)
+
+    with open(path, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(struct.pack("<BB", INDEX_VERSION, len(data)))
+        for category, entries in data.items():
+            write_string(f, category)
+            f.write(struct.pack("<H", len(entries)))
+            for entry in entries:
+                if isinstance(entry, str):
+                    entry = {"full_name": entry}
+                for field in APPLICATION_FIELDS:
+                    write_string(f, entry[field] if field in entry else None)
+        f.write(INDEX_MAGIC)  # marks a complete file
+
+def read_index(path: str) -> dict:
+    with open(path, "rb") as f:
+        buffer = f.read()
+    if buffer[:4] != INDEX_MAGIC or buffer[-4:] != INDEX_MAGIC or buffer[4] != INDEX_VERSION:
+        raise ValueError("Invalid index")
+
+    offset = 6
+    def read_string() -> str|None:
+        nonlocal offset
+        length = struct.unpack_from("<H", buffer, offset)[0]
+        offset += 2
+        if length == INDEX_NONE:
+            return None
+        offset += length
+        return buffer[offset - length:offset].decode("utf-8")
+
+    data = {}
+    for i in range(buffer[5]):
+        category = read_string()
+        count = struct.unpack_from("<H", buffer, offset)[0]
+        offset += 2
+        entries = data[category] = []
+        for j in range(count):
+            entry = {}
+            for field in APPLICATION_FIELDS:
+                if (value := read_string()) is not None:
+                    entry[field] = value
+            entries.append(entry)
+    return data
+
+def fetch_applications() -> dict:
+    path = CACHE_PATH + "applications.json"
+    headers_path = CACHE_PATH + "applications_headers.json"
+    index_path = CACHE_PATH + "applications.bin"
+    updated = False
+    data = None
+
+    # revalidate cached database using the previous response headers
+    headers = {}
+    if exists(path) and exists(headers_path):
+        try:
+            with open(headers_path, "r") as f:
+                cached_headers = json.load(f)
+        except (OSError, ValueError):
+            pass
+        else:
+            if "etag" in cached_headers:
+                headers["If-None-Match"] = cached_headers["etag"]
+            if "last-modified" in cached_headers:
+                headers["If-Modified-Since"] = cached_headers["last-modified"]
+
+    try:
+        fj.network.connect()  # ensure we're connected to wifi
+        response = fj.network.fetch(APPLICATIONS_URL, headers=headers, timeout=10)
+        try:
+            if response.status_code == 304:
+                log("Using cached applications database.")
+            elif response.status_code == 200:
+                # the previous database and index remain usable until the new copy is complete
+                try:
+                    write_response(response, path)
+                except OSError as e:
+                    if exists(path):
+                        raise
+
+                    # unable to cache database (ie: read-only filesystem or full sd card), read it into memory instead
+                    log("Unable to cache applications database. {:s}".format(str(e)))
+                    response.close()
+                    response = fj.network.fetch(APPLICATIONS_URL, timeout=10)
+                    if response.status_code != 200:
+                        raise ValueError("{:d} response".format(response.status_code))
+                    data = response.json()
+                else:
+                    updated = True
+                    if exists(index_path):
+                        os.remove(index_path)  # outdated
+                    with open(headers_path, "w") as f:
+                        json.dump({key: response.headers[key] for key in ("etag", "last-modified") if key in response.headers}, f)
+            else:
+                raise ValueError("{:d} response".format(response.status_code))
+        finally:
+            response.close()
+    except (OSError, RuntimeError, ValueError, AttributeError, HttpError) as e:
+        if not exists(path):
+            raise
+        log("Unable to fetch applications database, using cached copy. {:s}".format(str(e)))
+
+    if data is not None:
+        if not isinstance(data, dict):
+            raise ValueError("Invalid format")
+        return data
+
+    # use binary index of unchanged database to avoid parsing json
+    if not updated and exists(index_path):
+        try:
+            return read_index(index_path)
+        except (OSError, ValueError, IndexError) as e:
+            log("Unable to read applications index. {:s}".format(str(e)))
+
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("Invalid format")
+    except ValueError:
+        # force a full download on the next attempt
+        if exists(headers_path):
+            os.remove(headers_path)
+        raise
+
+    try:
+        write_index(index_path, data)
+    except (OSError, AttributeError, TypeError) as e:
+        log("Unable to write applications index. {:s}".format(str(e)))
+        if exists(index_path):
+            os.remove(index_path)
+    return data
+
 # use local or download applications database
 try:
     with open(APPLICATIONS_PATH, "r") as f:
@@ -377,33 +750,110 @@ try:
 except (OSError, ValueError, AttributeError) as e:
     log("Unable to read local applications database. {:s}".format(str(e)))
     try:
-        applications = json.loads(fj.fetch(
-            APPLICATIONS_URL,
-            force_content_type=adafruit_fruitjam.network.CONTENT_JSON,
-            timeout=10,
-        ))
-        if type(applications) is int:
-            raise ValueError("{:d} response".format(applications))
-    except (OSError, ValueError, AttributeError) as e:
+        applications = fetch_applications()
+    except (OSError, RuntimeError, ValueError, AttributeError, HttpError) as e:
         log("Unable to fetch applications database! {:s}".format(str(e)))
         reset(3)
 
-categories = sorted(applications.keys())
+def format_title(name: str, is_screensaver: bool = False) -> str:
+    # capitalize each word of the repository name
+    title = " ".join([word[0].upper() + word[1:].lower() for word in name.replace("-", " ").replace("_", " ").split()])
+
+    # remove common prefixes
+    if title.startswith("Fruit Jam "):
+        title = title[len("Fruit Jam "):]
+    if is_screensaver and title.startswith("Screensaver "):
+        title = title[len("Screensaver "):]
+    elif title.startswith("Application "):
+        title = title[len("Application "):]
+    return title
+
+def get_application_info(entry: str|dict, category: str) -> dict:
+    # entries are either a repository name or prebuilt details including the name
+    if isinstance(entry, str):
+        entry = {"full_name": entry}
+    full_name = entry["full_name"]
+    repo_owner, repo_name = full_name.split("/")
+    application = {
+        "full_name": full_name,
+        "owner": repo_owner,
+        "name": repo_name,
+        "cache_name": full_name.replace("/", "_"),
+        "title": format_title(repo_name, category == SCREENSAVERS_CATEGORY),
+        "repo_url": REPO_URL.format(full_name),
+        "metadata_url": METADATA_URL.format(full_name),
+    }
+    for field in APPLICATION_FIELDS:
+        if field in entry:
+            application[field] = entry[field]
+    return application
+
+categories = tuple(sorted(applications))
+category_indices = {category: index for index, category in enumerate(categories)}
+
+# precompute details of each application
+for category in categories:
+    applications[category] = [get_application_info(entry, category) for entry in applications[category]]
 selected_category = None
 
 # setup menu
-category_group = displayio.Group()
-root_group.append(category_group)
 MENU_WIDTH = (display.width - MENU_GAP * (len(categories) + 1)) // len(categories)
+MENU_TILE_WIDTH = MENU_WIDTH + MENU_GAP
+
+def fill_round_rect(bitmap: displayio.Bitmap, x: int, y: int, width: int, height: int, radius: int, value: int) -> None:
+    for row in range(height):
+        # inset each row within the corners along a quarter circle
+        dy = radius - min(row, height - 1 - row)
+        inset = radius - int(math.sqrt(radius * radius - dy * dy)) if dy > 0 else 0
+        bitmaptools.fill_region(bitmap, x + inset, y + row, x + width - inset, y + row + 1, value)
+
+def draw_menu_tab(bitmap: displayio.Bitmap, x: int, y: int, label: str, selected: bool) -> None:
+    # draw outline and body
+    fill_round_rect(bitmap, x, y, MENU_WIDTH, MENU_HEIGHT, MENU_RADIUS, 1)
+    if not selected:
+        fill_round_rect(bitmap, x + 1, y + 1, MENU_WIDTH - 2, MENU_HEIGHT - 2, MENU_RADIUS - 1, 0)
+
+    # draw centered label text
+    font_width, font_height = FONT.get_bounding_box()[:2]
+    text_x = x + (MENU_WIDTH - len(label) * font_width) // 2
+    text_y = y + (MENU_HEIGHT - font_height) // 2
+    text_value = 0 if selected else 1
+    for char_index, char in enumerate(label):
+        if (glyph := FONT.get_glyph(ord(char))) is None:
+            continue
+        glyph_columns = glyph.bitmap.width // glyph.width
+        source_x = (glyph.tile_index % glyph_columns) * glyph.width
+        source_y = (glyph.tile_index // glyph_columns) * glyph.height
+        dest_x = text_x + char_index * font_width
+        for gx in range(glyph.width):
+            if dest_x + gx <= x or dest_x + gx >= x + MENU_WIDTH - 1:
+                continue  # clip to tab
+            for gy in range(glyph.height):
+                if glyph.bitmap[source_x + gx, source_y + gy]:
+                    bitmap[dest_x + gx, text_y + gy] = text_value
+
+# pre-render each category tab with the unselected state in the first row and selected state in the second
+category_bitmap = displayio.Bitmap(MENU_TILE_WIDTH * len(categories), MENU_HEIGHT * 2, 2)
 for index, category in enumerate(categories):
-    category_button = Button(
-        x=(MENU_WIDTH + MENU_GAP) * index + MENU_GAP,
-        y=TITLE_HEIGHT * SCALE,
-        width=MENU_WIDTH,
-        label=category,
-        **BUTTON_PROPS,
-    )
-    category_group.append(category_button)
+    draw_menu_tab(category_bitmap, MENU_TILE_WIDTH * index, 0, category, False)
+    draw_menu_tab(category_bitmap, MENU_TILE_WIDTH * index, MENU_HEIGHT, category, True)
+
+category_group = displayio.Group()
+root_group.append(category_group)
+
+category_tg = displayio.TileGrid(
+    bitmap=category_bitmap,
+    pixel_shader=theme_palette,
+    width=len(categories),
+    height=1,
+    tile_width=MENU_TILE_WIDTH,
+    tile_height=MENU_HEIGHT,
+    x=MENU_GAP,
+    y=TITLE_HEIGHT * SCALE,
+)
+for index in range(len(categories)):
+    category_tg[index] = index
+category_group.append(category_tg)
 
 # setup items
 item_grid = GridLayout(
@@ -438,7 +888,7 @@ for index in range(PAGE_SIZE):
     item_title = Label(
         font=FONT,
         text="[title]",
-        color=(config.palette_fg if config is not None else 0xffffff),
+        color=PALETTE_FG,
         anchor_point=(0, 0),
         anchored_position=(ITEM_HEIGHT, (ITEM_HEIGHT - item_icon.tile_height) // 2),
         scale=SCALE,
@@ -448,7 +898,7 @@ for index in range(PAGE_SIZE):
     item_author = Label(
         font=FONT,
         text="[author]",
-        color=(config.palette_fg if config is not None else 0xffffff),
+        color=PALETTE_FG,
         anchor_point=(0, 0),
         anchored_position=(ITEM_HEIGHT, item_title.y + item_title.height),
     )
@@ -460,7 +910,7 @@ for index in range(PAGE_SIZE):
         width=ITEM_WIDTH - ITEM_HEIGHT,
         height=item_icon.tile_height - item_title.height - item_author.height,
         align=TextBox.ALIGN_LEFT,
-        color=(config.palette_fg if config is not None else 0xffffff),
+        color=PALETTE_FG,
         anchor_point=(0, 0),
         anchored_position=(ITEM_HEIGHT, item_author.y + item_author.height),
     )
@@ -468,10 +918,13 @@ for index in range(PAGE_SIZE):
 
     item_grid.add_content(
         cell_content=item_group,
-        grid_position=(index % PAGE_COLUMNS, index // PAGE_COLUMNS),
+        grid_position=GRID_POS[index],
         cell_size=(1, 1),
     )
 
+# item lookup by page slot
+item_groups = tuple(item_grid.get_content(position) for position in GRID_POS)
+
 # setup arrows
 original_arrow_btn_color = left_palette[2]
 
@@ -503,55 +956,69 @@ exit_button = TileGridButton(
     y=0,
     width=TITLE_HEIGHT,
     height=TITLE_HEIGHT,
-    fill_color=(config.palette_bg if config is not None else 0x222222),
-    label_color=(config.palette_fg if config is not None else 0xffffff),
-    outline_color=(config.palette_bg if config is not None else 0x222222),
-    selected_fill=(config.palette_fg if config is not None else 0xffffff),
-    selected_label=(config.palette_bg if config is not None else 0x222222),
-    selected_outline=(config.palette_fg if config is not None else 0xffffff),
+    fill_color=PALETTE_BG,
+    label_color=PALETTE_FG,
+    outline_color=PALETTE_BG,
+    selected_fill=PALETTE_FG,
+    selected_label=PALETTE_BG,
+    selected_outline=PALETTE_FG,
 )
 arrow_group.append(exit_button)
 
 # setup dialog
-dialog_group = displayio.Group()
-dialog_group.hidden = True
-root_group.append(dialog_group)
-
-dialog_border = displayio.TileGrid(
-    bitmap=displayio.Bitmap(DIALOG_WIDTH, DIALOG_HEIGHT, 1),
-    pixel_shader=fg_palette,
-    x=(display.width - DIALOG_WIDTH) // 2,
-    y=TITLE_HEIGHT * SCALE + DIALOG_MARGIN,
-)
-dialog_group.append(dialog_border)
-
-dialog_bg = displayio.TileGrid(
-    bitmap=displayio.Bitmap(DIALOG_WIDTH - DIALOG_BORDER * 2, DIALOG_HEIGHT - DIALOG_BORDER * 2, 1),
-    pixel_shader=bg_palette,
-    x=dialog_border.x + DIALOG_BORDER,
-    y=dialog_border.y + DIALOG_BORDER,
-)
-dialog_group.append(dialog_bg)
-
-dialog_content = TextBox(
-    font=FONT,
-    text="[content]",
-    width=DIALOG_WIDTH - DIALOG_BORDER * 2 - DIALOG_MARGIN * 2,
-    height=DIALOG_HEIGHT - DIALOG_BORDER * 2 - DIALOG_MARGIN * 3 - MENU_HEIGHT,
-    align=TextBox.ALIGN_CENTER,
-    color=(config.palette_fg if config is not None else 0xffffff),
-    x=dialog_bg.x + DIALOG_MARGIN,
-    y=dialog_bg.y + DIALOG_MARGIN,
-)
-dialog_group.append(dialog_content)
-
 dialog_buttons = displayio.Group(scale=SCALE)
 dialog_buttons.hidden = True
 root_group.append(dialog_buttons)
 
+# dialog elements are only constructed once a dialog is first shown
+dialog_group = None
+dialog_content = None
+
+def _ensure_dialog() -> None:
+    global dialog_group, dialog_content
+    if dialog_group is not None:
+        return
+
+    dialog_group = displayio.Group()
+    dialog_group.hidden = True
+    root_group.insert(root_group.index(dialog_buttons), dialog_group)
+
+    dialog_border = vectorio.Rectangle(
+        pixel_shader=theme_palette,
+        width=DIALOG_WIDTH,
+        height=DIALOG_HEIGHT,
+        x=(display.width - DIALOG_WIDTH) // 2,
+        y=TITLE_HEIGHT * SCALE + DIALOG_MARGIN,
+        color_index=1,
+    )
+    dialog_group.append(dialog_border)
+
+    dialog_bg = vectorio.Rectangle(
+        pixel_shader=theme_palette,
+        width=DIALOG_WIDTH - DIALOG_BORDER * 2,
+        height=DIALOG_HEIGHT - DIALOG_BORDER * 2,
+        x=dialog_border.x + DIALOG_BORDER,
+        y=dialog_border.y + DIALOG_BORDER,
+    )
+    dialog_group.append(dialog_bg)
+
+    dialog_content = TextBox(
+        font=FONT,
+        text="[content]",
+        width=DIALOG_WIDTH - DIALOG_BORDER * 2 - DIALOG_MARGIN * 2,
+        height=DIALOG_HEIGHT - DIALOG_BORDER * 2 - DIALOG_MARGIN * 3 - MENU_HEIGHT,
+        align=TextBox.ALIGN_CENTER,
+        color=PALETTE_FG,
+        x=dialog_bg.x + DIALOG_MARGIN,
+        y=dialog_bg.y + DIALOG_MARGIN,
+    )
+    dialog_group.append(dialog_content)
+
 def show_dialog(content: str, actions: list = None) -> None:
+    _ensure_dialog()
+
     # update content
-    dialog_content.text = content
+    set_text(dialog_content, content)
 
     # create buttons
     if actions is not None:
@@ -581,15 +1048,16 @@ def show_dialog(content: str, actions: list = None) -> None:
     dialog_buttons.hidden = False
 
 def hide_dialog() -> None:
-    # clear text
-    dialog_content.text = ""
+    if dialog_group is not None:
+        # clear text
+        set_text(dialog_content, "")
+
+        # hide dialog
+        dialog_group.hidden = True
 
     # remove buttons
     while len(dialog_buttons):
         dialog_buttons.pop()
-
-    # hide dialog
-    dialog_group.hidden = True
     dialog_buttons.hidden = True
 
     # show other UI elements
@@ -601,128 +1069,237 @@ def hide_dialog() -> None:
 
 def select_category(name: str) -> None:
     global selected_category
-    if name not in categories or name == selected_category:
+    if name not in category_indices or name == selected_category:
         return
-    selected_category = name
 
-    # update button states
-    for category_button in category_group:
-        category_button.selected = category_button.label == name
-    
-    # hide all items
-    for index in range(PAGE_SIZE):
-        item_grid.get_content((index % PAGE_COLUMNS, index // PAGE_COLUMNS)).hidden = True
+    # update tab states
+    if selected_category is not None:
+        index = category_indices[selected_category]
+        category_tg[index] = index
+    index = category_indices[name]
+    category_tg[index] = index + len(categories)
+
+    selected_category = name
 
     # load first page of items
     show_page()
 
 current_page = 0
 def show_page(page: int = 0) -> None:
-    global selected_category, current_page
+    global selected_category, current_page, page_task, page_id
+
+    # bind frequently accessed values to locals
+    category_applications = applications[selected_category]
 
     # determine indices
     start = page * PAGE_SIZE
-    end = min((page + 1) * PAGE_SIZE, len(applications[selected_category]))
-    if start < 0 or start >= len(applications[selected_category]):
+    end = min((page + 1) * PAGE_SIZE, len(category_applications))
+    if start < 0 or (page and start >= len(category_applications)):
+        return  # the first page is still shown for empty categories to clear the previous items
+
+    # batch display updates to avoid redundant refreshes
+    with RefreshBatch():
+
+        # hide unused items
+        for slot in range(end - start, PAGE_SIZE):
+            item_groups[slot].hidden = True
+            slot_contents[slot] = None
+
+        # update page label
+        current_page = page
+        total_pages = max(math.ceil(len(category_applications) / PAGE_SIZE), 1)
+        set_text(page_label, "{:d}/{:d}".format(page + 1, total_pages))
+
+        # toggle arrows
+        left_arrow.hidden = not page
+        right_arrow.hidden = page + 1 == total_pages
+
+        # display default details
+        for slot, index in enumerate(range(start, end)):
+            item_group = item_groups[slot]
+            item_icon, item_installed, item_title, item_author, item_description = item_group
+
+            application = category_applications[index]
+            item_installed.hidden = not is_application_installed(application["name"])
+
+            # skip items which are already fully loaded
+            if slot_contents[slot] == application["full_name"]:
+                item_group.hidden = False
+                continue
+            slot_contents[slot] = None
+
+            # set default details
+            item_icon.bitmap = default_icon_bmp
+            item_icon.pixel_shader = default_icon_palette
+            set_text(item_title, application["title"])
+            set_text(item_author, application["owner"])
+            set_text(item_description, application["description"] if "description" in application else "Loading...")
+            item_group.hidden = False
+        display.refresh()
+
+    # read external application data in the background
+    if page_task is not None:
+        page_task.cancel()
+    page_id += 1
+    page_task = asyncio.create_task(load_page(page_id, category_applications, start, end)) if end > start else None
+
+# name of the application loaded within each item slot
+slot_contents = [None] * PAGE_SIZE
+
+def load_icon(path: str) -> displayio.OnDiskBitmap:
+    # read icon pixels from the sd card as they are displayed rather than holding them in memory
+    return displayio.OnDiskBitmap(path)
+
+page_task = None
+page_id = 0
+async def load_page(load_id: int, category_applications: list, start: int, end: int) -> None:
+    slots = [(slot, index) for slot, index in enumerate(range(start, end)) if slot_contents[slot] is None]
+
+    # interleave network requests of all items so that each item is updated as soon as its data is available
+    results = await asyncio.gather(*[load_item(load_id, category_applications, index, slot) for slot, index in slots], return_exceptions=True)
+    if load_id != page_id:
         return
 
-    # hide all items
-    for index in range(PAGE_SIZE):
-        item_grid.get_content((index % PAGE_COLUMNS, index // PAGE_COLUMNS)).hidden = True
-
-    # update page label
-    current_page = page
-    total_pages = math.ceil(len(applications[selected_category]) / PAGE_SIZE)
-    page_label.text = "{:d}/{:d}".format(page + 1, total_pages)
+    # load icons once all item details are displayed
+    await asyncio.gather(*[load_item_icon(load_id, slot, *result) for (slot, index), result in zip(slots, results) if isinstance(result, tuple)], return_exceptions=True)
+    del results
 
-    # toggle arrows
-    left_arrow.hidden = not page
-    right_arrow.hidden = page + 1 == total_pages
+    # cleanup once per page rather than after every item
+    gc.collect()
+    if load_id != page_id:
+        return
+    log("Page loaded!")
 
-    # display default details
-    for index in range(start, end):
-        item_group = item_grid.get_content((index % PAGE_COLUMNS, (index // PAGE_COLUMNS) % PAGE_ROWS))
-        item_icon, item_installed, item_title, item_author, item_description = item_group
+    # warm the cache with the following page while the user is viewing this one
+    for index in range(end, min(end + PAGE_SIZE, len(category_applications))):
+        application = category_applications[index]
 
-        full_name = applications[selected_category][index]
-        repo_owner, repo_name = full_name.split("/")
-
-        # format title from repository name
-        title = repo_name.replace("-", " ").replace("_", " ").strip()
-        title = " ".join(map(lambda word: word[0].upper() + word[1:].lower(), title.split(" ")))
-        if title.startswith("Fruit Jam "):
-            title = title[len("Fruit Jam "):].strip()
-        if selected_category == SCREENSAVERS_CATEGORY and title.startswith("Screensaver "):
-            title = title[len("Screensaver "):].strip()
-        elif title.startswith("Application "):
-            title = title[len("Application "):].strip()
-        
-        # set default details
-        item_icon.bitmap = default_icon_bmp
-        item_icon.pixel_shader = default_icon_palette
-        item_installed.hidden = not is_application_installed(repo_name)
-        item_title.text = title
-        item_author.text = repo_owner
-        item_description.text = "Loading..."
-        item_group.hidden = False
-    
-    # read external application data
-    for index in range(start, end):
-        item_group = item_grid.get_content((index % PAGE_COLUMNS, (index // PAGE_COLUMNS) % PAGE_ROWS))
-        item_icon, item_installed, item_title, item_author, item_description = item_group
+        # don't spend the unauthenticated GitHub API rate limit on pages which may never be opened
+        if "default_branch" not in application and not api_token:
+            continue
 
-        full_name = applications[selected_category][index]
+        # each request blocks input handling, so wait until the user is idle
+        while time.monotonic() - input_time < PREFETCH_IDLE:
+            await asyncio.sleep(PREFETCH_IDLE)
+            if load_id != page_id:
+                return
 
-        log("Reading repository data from {:s}".format(full_name))
+        await prefetch_item(application)
+        if load_id != page_id:
+            return
+    gc.collect()
 
-        # get repository info
-        try:
+async def prefetch_item(application: dict) -> None:
+    # download item data into the cache without updating the display
+    try:
+        if "default_branch" in application:
+            repository = metadata = application  # prebuilt details
+        else:
             repository = download_json(
-                url=REPO_URL.format(full_name),
-                name=full_name.replace("/", "_"),
+                url=application["repo_url"],
+                name=application["cache_name"],
+                fields=REPOSITORY_FIELDS,
             )
-        except (OSError, ValueError, HttpError) as e:
-            item_description.text = ""
+            await asyncio.sleep(0)
+            metadata = download_json(
+                url=application["metadata_url"],
+                name=application["cache_name"] + "_metadata",
+                fields=METADATA_FIELDS,
+            )
+            await asyncio.sleep(0)
+        if "icon" in metadata:
+            download_image(
+                ICON_URL.format(application["full_name"], repository["default_branch"], metadata["icon"]),
+                repository["name"] + "_" + metadata["icon"],
+            )
+    except (OSError, RuntimeError, ValueError, KeyError, HttpError):
+        pass  # the item will be reported when its page is shown
+    await asyncio.sleep(0)
+
+async def load_item(load_id: int, category_applications: list, index: int, slot: int) -> tuple|None:
+    item_group = item_groups[slot]
+    item_icon, item_installed, item_title, item_author, item_description = item_group
+
+    application = category_applications[index]
+    full_name = application["full_name"]
+
+    # prebuilt details were already displayed, only the icon is left to be loaded
+    if "default_branch" in application:
+        return full_name, application, application
+
+    log("Reading repository data from {:s}".format(full_name), False)
+
+    # get repository info
+    try:
+        repository = download_json(
+            url=application["repo_url"],
+            name=application["cache_name"],
+            fields=REPOSITORY_FIELDS,
+        )
+    except (OSError, ValueError, HttpError) as e:
+        if load_id != page_id:
+            return
+        with RefreshBatch():
+            set_text(item_description, "")
             log("Unable to read repository data from {:s}! {:s}".format(full_name, str(e)))
-            time.sleep(1)
-            continue
-        else:
-            item_author.text = repository["owner"]["login"]
-            item_description.text = repository["description"]
+        await asyncio.sleep(1)
+        return
+    await asyncio.sleep(0)  # allow other items and input to be processed
+
+    # read metadata from repository
+    if load_id != page_id:
+        return
+    log("Reading metadata from {:s}".format(full_name), False)
+    try:
+        metadata = download_json(
+            url=application["metadata_url"],
+            name=application["cache_name"] + "_metadata",
+            fields=METADATA_FIELDS,
+        )
+    except (OSError, ValueError, HttpError) as e:
+        metadata = {}
+        if load_id == page_id:
+            log("Unable to read metadata from {:s}! {:s}".format(full_name, str(e)))
+    if load_id != page_id:
+        return
+
+    # display all details of the item in a single refresh
+    with RefreshBatch():
+        set_text(item_author, repository["owner"]["login"])
+        set_text(item_description, metadata["description"] if "description" in metadata else repository["description"] or "")
+        if "title" in metadata:
+            set_text(item_title, metadata["title"])
+    await asyncio.sleep(0)
+
+    return full_name, repository, metadata
+
+async def load_item_icon(load_id: int, slot: int, full_name: str, repository: dict, metadata: dict) -> None:
+    item_icon = item_groups[slot][0]
 
-        # read metadata from repository
-        log("Reading metadata from {:s}".format(full_name))
+    if "icon" in metadata and load_id == page_id:
+        log("Downloading icon from {:s}".format(full_name), False)
         try:
-            metadata = download_json(
-                url=METADATA_URL.format(full_name),
-                name=full_name.replace("/", "_") + "_metadata",
+            icon_path = download_image(
+                ICON_URL.format(full_name, repository["default_branch"], metadata["icon"]),
+                repository["name"] + "_" + metadata["icon"],
             )
         except (OSError, ValueError, HttpError) as e:
-            log("Unable to read metadata from {:s}! {:s}".format(full_name, str(e)))
+            if load_id == page_id:
+                log("Unable to download icon image from {:s}! {:s}".format(full_name, str(e)))
         else:
-            item_title.text = metadata["title"]
-
-            if "description" in metadata:
-                item_description.text = metadata["description"]
-
-            if "icon" in metadata:
-                log("Downloading icon from {:s}".format(full_name))
+            if load_id == page_id:
                 try:
-                    icon_path = download_image(
-                        ICON_URL.format(full_name, repository["default_branch"], metadata["icon"]),
-                        repository["name"] + "_" + metadata["icon"],
-                    )
-                except (OSError, ValueError, HttpError) as e:
-                    log("Unable to download icon image from {:s}! {:s}".format(full_name, str(e)))
+                    icon_bmp = load_icon(icon_path)
+                except (OSError, ValueError, NotImplementedError) as e:
+                    log("Unable to load icon image from {:s}! {:s}".format(full_name, str(e)))
                 else:
-                    icon_bmp, icon_palette = adafruit_imageload.load(icon_path)
                     item_icon.bitmap = icon_bmp
-                    item_icon.pixel_shader = icon_palette
-
-        # cleanup before loading next item
-        gc.collect()
+                    item_icon.pixel_shader = icon_bmp.pixel_shader
 
-    log("Page loaded!")
+    # skip this item on future page updates
+    if load_id == page_id:
+        slot_contents[slot] = full_name
+    await asyncio.sleep(0)
 
 def next_page() -> None:
     global current_page
@@ -736,9 +1313,6 @@ def refresh_page() -> None:
     global current_page
     show_page(current_page)
 
-# select first category and show page items
-select_category(categories[0])
-
 # application download
 
 def download_application(full_name: str = None) -> bool:
@@ -764,6 +1338,7 @@ def download_application(full_name: str = None) -> bool:
         release = download_json(
             url=RELEASE_URL.format(full_name),
             name=full_name.replace("/", "_") + "_release",
+            fields=RELEASE_FIELDS,
         )
     except (OSError, ValueError, HttpError) as e:
         log("Unable to read release data from {:s}! {:s}".format(full_name, str(e)))
@@ -774,6 +1349,7 @@ def download_application(full_name: str = None) -> bool:
             repository = download_json(
                 url=REPO_URL.format(full_name),
                 name=full_name.replace("/", "_"),
+                fields=REPOSITORY_FIELDS,
             )
         except (OSError, ValueError, HttpError) as e:
             log("Unable to read repository data from {:s}! {:s}".format(full_name, str(e)))
@@ -787,7 +1363,7 @@ def download_application(full_name: str = None) -> bool:
         if "assets" in release and len(assets := list(filter(lambda x: x["name"].endswith(".zip"), release["assets"]))):
             download_url = assets[0]["browser_download_url"]
         if not download_url:
-            log("Unable to locate release assets for {:s}!", full_name)
+            log("Unable to locate release assets for {:s}!".format(full_name))
             return False
 
     # download project bundle
@@ -867,7 +1443,7 @@ def open_application(full_name: str = None) -> None:
         if selected_application is None:
             return False
         full_name = selected_application
-    repo_owner, repo_name = selected_application.split("/")
+    repo_owner, repo_name = full_name.split("/")
     
     filepath = get_application_file(repo_name)
     if filepath is not None and is_application_installed(repo_name) and exists(filepath):
@@ -888,55 +1464,56 @@ def select_application(index: int|tuple) -> None:
 
     if isinstance(index, tuple):
         index = index[1] * PAGE_COLUMNS + index[0]
+    slot = index
 
     index += current_page * PAGE_SIZE
     if index < 0 or index >= len(applications[selected_category]):
         return
     
-    selected_application = applications[selected_category][index]
-    repo_owner, repo_name = selected_application.split("/")
+    application = applications[selected_category][index]
+    selected_application = application["full_name"]
+    repo_name = application["name"]
 
     is_screensaver = selected_category == SCREENSAVERS_CATEGORY
     application_type = "screensaver" if is_screensaver else "application"
-    
-    # hide other UI elements
-    category_group.hidden = True
-    item_grid.hidden = True
-    arrow_group.hidden = True
-    
-    # populate dialog info
-    item_group = item_grid.get_content((index % PAGE_COLUMNS, (index // PAGE_COLUMNS) % PAGE_ROWS))
-    item_icon, item_installed, item_title, item_author, item_description = item_group
 
-    path = get_application_path(repo_name)
-    if item_installed.hidden:
-        show_dialog(
-            content="Would you like to download and install \"{:s}\" by {:s} to your SD card at {:s}?".format(
-                item_title.text,
-                item_author.text,
-                path
-            ),
-            actions=[
-                ("Cancel", deselect_application),
-                ("Download", toggle_application),
-            ],
-        )
-    else:
-        show_dialog(
-            content="The {:s}, \"{:s}\", is already installed. Would you like to remove it from your SD card at {:s}? Any save data within /saves will be retained.".format(
-                application_type,
-                item_title.text,
-                path
-            ),
-            actions=list(filter(lambda x: x, [
-                ("Cancel", deselect_application),
-                ("Remove", toggle_application),
-                ("Open", open_application) if not is_screensaver else None,
-            ])),
-        )
+    # batch display updates to avoid redundant refreshes
+    with RefreshBatch():
+        # hide other UI elements
+        category_group.hidden = True
+        item_grid.hidden = True
+        arrow_group.hidden = True
+    
+        # populate dialog info
+        item_group = item_groups[slot]
+        item_icon, item_installed, item_title, item_author, item_description = item_group
 
-    dialog_group.hidden = False
-    dialog_buttons.hidden = False
+        path = get_application_path(repo_name)
+        if item_installed.hidden:
+            show_dialog(
+                content="Would you like to download and install \"{:s}\" by {:s} to your SD card at {:s}?".format(
+                    item_title.text,
+                    item_author.text,
+                    path
+                ),
+                actions=[
+                    ("Cancel", deselect_application),
+                    ("Download", toggle_application),
+                ],
+            )
+        else:
+            show_dialog(
+                content="The {:s}, \"{:s}\", is already installed. Would you like to remove it from your SD card at {:s}? Any save data within /saves will be retained.".format(
+                    application_type,
+                    item_title.text,
+                    path
+                ),
+                actions=list(filter(lambda x: x, [
+                    ("Cancel", deselect_application),
+                    ("Remove", toggle_application),
+                    ("Open", open_application) if not is_screensaver else None,
+                ])),
+            )
 
 def deselect_application() -> None:
     global selected_application
@@ -945,7 +1522,8 @@ def deselect_application() -> None:
     selected_application = None
 
     # hide dialog and show other UI elements
-    hide_dialog()
+    with RefreshBatch():
+        hide_dialog()
 
 def toggle_application(full_name: str = None) -> bool:
     global selected_application, current_page
@@ -953,7 +1531,7 @@ def toggle_application(full_name: str = None) -> bool:
         if selected_application is None:
             return False
         full_name = selected_application
-    repo_owner, repo_name = selected_application.split("/")
+    repo_owner, repo_name = full_name.split("/")
 
     if not is_application_installed(repo_name):
         result = download_application(full_name)
@@ -975,9 +1553,9 @@ def set_selected_item_color(value: bool, item: tuple|AnchoredTileGrid|None = Non
         item = selected_item
     if item is not None:
         if isinstance(item, tuple):
-            item_grid.get_content(item)[2].background_color = (config.palette_accent if config is not None else 0x008800) if value else None
+            item_groups[item[1] * PAGE_COLUMNS + item[0]][2].background_color = PALETTE_ACCENT if value else None
         elif isinstance(item, AnchoredTileGrid):
-            item.pixel_shader[2] = (config.palette_accent if config is not None else 0x008800) if value else original_arrow_btn_color
+            item.pixel_shader[2] = PALETTE_ACCENT if value else original_arrow_btn_color
 
 def select_item(value: tuple|AnchoredTileGrid|None) -> None:
     global selected_item
@@ -1018,7 +1596,7 @@ def change_selected_item(dx: int, dy: int) -> bool:
             if not right_arrow.hidden:
                 value = right_arrow
                 break
-        elif not item_grid.get_content(value).hidden:
+        elif not item_groups[value[1] * PAGE_COLUMNS + value[0]].hidden:
             break
 
     select_item(value)
@@ -1026,8 +1604,40 @@ def change_selected_item(dx: int, dy: int) -> bool:
 select_item((0, 0))  # initial selection
 
 # mouse control
+
+# clickable screen regions stored as parallel arrays of bounds and their handlers
+hit_x0, hit_y0, hit_x1, hit_y1 = array("h"), array("h"), array("h"), array("h")
+hit_handlers = []
+
+def add_hit_region(x0: int, y0: int, x1: int, y1: int, handler) -> None:
+    hit_x0.append(x0)
+    hit_y0.append(y0)
+    hit_x1.append(x1)
+    hit_y1.append(y1)
+    hit_handlers.append(handler)
+
+for slot, (column, row) in enumerate(GRID_POS):
+    add_hit_region(
+        item_grid.x + column * ITEM_WIDTH, item_grid.y + row * ITEM_HEIGHT,
+        item_grid.x + (column + 1) * ITEM_WIDTH, item_grid.y + (row + 1) * ITEM_HEIGHT,
+        lambda slot=slot: select_application(slot),
+    )
+for arrow, handler in ((right_arrow, next_page), (left_arrow, previous_page)):
+    add_hit_region(
+        arrow.x * SCALE, arrow.y * SCALE,
+        (arrow.x + arrow.tile_width) * SCALE, (arrow.y + arrow.tile_height) * SCALE,
+        handler,
+    )
+add_hit_region(0, 0, TITLE_HEIGHT * SCALE, TITLE_HEIGHT * SCALE, reset)
+for index in range(len(categories)):
+    add_hit_region(
+        category_tg.x + index * MENU_TILE_WIDTH, category_tg.y,
+        category_tg.x + index * MENU_TILE_WIDTH + MENU_WIDTH, category_tg.y + MENU_HEIGHT,
+        lambda index=index: select_category(categories[index]),
+    )
+
 mouse = None
-if config is not None and config.use_mouse and (mouse := adafruit_usb_host_mouse.find_and_init_boot_mouse()) is not None:
+if getattr(config, "use_mouse", False) and (mouse := adafruit_usb_host_mouse.find_and_init_boot_mouse()) is not None:
     mouse.scale = SCALE
     mouse.x = DISPLAY_WIDTH // 2
     mouse.y = DISPLAY_HEIGHT // 2
@@ -1059,12 +1669,20 @@ def key_unshift(buffer: str) -> tuple:
         key, buffer = str_unshift(buffer, key, 2)
     return key, buffer
 
-try:
-    previous_mouse_state = False
-    while True:
+input_time = time.monotonic()  # last time keyboard or mouse input was received
+def get_input_interval(interval: float, active: bool) -> float:
+    global input_time
+    if active:
+        input_time = time.monotonic()
+        return INPUT_INTERVAL_MIN
+    return min(interval * 2, INPUT_INTERVAL_MAX)
 
-        # keyboard input
-        if (available := supervisor.runtime.serial_bytes_available) > 0:
+async def keyboard_task() -> None:
+    interval = INPUT_INTERVAL_MIN
+    while True:
+        available = supervisor.runtime.serial_bytes_available
+        interval = get_input_interval(interval, available > 0)
+        if available > 0:
             buffer = sys.stdin.read(available)
             while True:
                 key, buffer = key_unshift(buffer)
@@ -1111,30 +1729,39 @@ try:
                             pass
                         else:
                             button.click()
+        await asyncio.sleep(interval)
 
-        # mouse input
-        if mouse is not None and mouse.update() is not None:
+async def mouse_task() -> None:
+    if mouse is None:
+        return
+    previous_mouse_state = False
+    interval = INPUT_INTERVAL_MIN
+    while True:
+        buttons = mouse.update()
+        interval = get_input_interval(interval, buttons is not None)
+        if buttons is not None:
             mouse_state = "left" in mouse.pressed_btns
             if mouse_state and not previous_mouse_state:
                 if dialog_buttons.hidden:
-                    if (clicked_cell := item_grid.which_cell_contains((mouse.x * SCALE, mouse.y * SCALE))) is not None:
-                        select_application(clicked_cell)
-                    elif not right_arrow.hidden and right_arrow.contains((mouse.x, mouse.y, 0)):
-                        next_page()
-                    elif not left_arrow.hidden and left_arrow.contains((mouse.x, mouse.y, 0)):
-                        previous_page()
-                    elif exit_button.contains((mouse.x, mouse.y)):
-                        reset()
-                    else:
-                        for button in category_group:
-                            if button.contains((mouse.x * SCALE, mouse.y * SCALE)):
-                                select_category(button.label)
-                                break
+                    mx, my = mouse.x * SCALE, mouse.y * SCALE
+                    for index in range(len(hit_handlers)):
+                        if hit_x0[index] <= mx < hit_x1[index] and hit_y0[index] <= my < hit_y1[index]:
+                            hit_handlers[index]()
+                            break
                 else:
                     for button in dialog_buttons:
                         if button.contains((mouse.x, mouse.y, 0)):
                             button.click()
             previous_mouse_state = mouse_state
+        await asyncio.sleep(interval)
+
+async def main() -> None:
+    # select first category and show page items
+    select_category(categories[0])
 
+    await asyncio.gather(keyboard_task(), mouse_task())
+
+try:
+    asyncio.run(main())
 except KeyboardInterrupt:
     reset()
@@ -3,28 +3,72 @@
 #
 # SPDX-License-Identifier: MIT
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
+import io
+try:
+    import ujson as json
+except ImportError:
+    import json
 import os
 from pathlib import Path
 import re
+import shutil
+import sys
+from types import SimpleNamespace
 
-from github import Github, Repository, ContentFile
-from mdutils.mdutils import MdUtils
+from github import Github
 
 DATABASE_FILE = "applications.json"
+MINIFIED_DATABASE_FILE = "applications.min.json"
 MARKDOWN_FILE = "README.md"
 
+MAX_WORKERS = 8  # repositories read from the GitHub API at once
+
+TITLE_PATTERN = re.compile(r'^# (.*)$', re.MULTILINE)
+SCREENSHOT_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+
+def write_file(path: Path, contents: bytes) -> None:
+    # write into a temporary file first so that an interrupted build never leaves a partial cache file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(contents)
+    os.replace(tmp_path, path)
+
+def check() -> bool:
+    # verify that the minified database lists the same repositories as the source database
+    db_dir = Path(__file__).parent
+    try:
+        with open(db_dir / DATABASE_FILE, "r") as f:
+            database = json.load(f)
+        with open(db_dir / MINIFIED_DATABASE_FILE, "r") as f:
+            minified_database = json.load(f)
+    except Exception as e:
+        print(e)
+        return False
+
+    # prebuilt entries are compared by their repository name
+    minified_database = {
+        category: [entry if isinstance(entry, str) else entry["full_name"] for entry in entries]
+        for category, entries in minified_database.items()
+    }
+    if minified_database != database:
+        print("{:s} is out of date, run database/build.py to regenerate it".format(MINIFIED_DATABASE_FILE))
+        return False
+    print("{:s} is up to date".format(MINIFIED_DATABASE_FILE))
+    return True
+
 def main(reset: bool = False):
     db_dir = Path(__file__).parent
 
     # setup cache
     cache_dir = db_dir / ".cache"
     if reset and os.path.exists(cache_dir):
-        os.rmdir(cache_dir)
+        shutil.rmtree(cache_dir)
     cache_dir.mkdir(exist_ok=True)
 
-    def read_file(repo: Repository, filename: str, allow_empty: bool = True) -> str|object|list:
-        print(f"Reading {filename}: ", end="")
+    def read_file(repo: SimpleNamespace, filename: str, allow_empty: bool = True) -> str|object|list:
+        status = f"Reading {repo.full_name}/{filename}: "
 
         repo_dir = cache_dir / repo.full_name
         repo_dir.mkdir(parents=True, exist_ok=True)
@@ -34,35 +78,30 @@ def main(reset: bool = False):
 
         if os.path.exists(path):
             try:
-                with open(path, "r") as f:
-                    if is_json:
-                        contents = json.load(f)
-                    else:
-                        contents = f.read()
-            except Exception as e:
+                with open(path, "rb") as f:
+                    contents = f.read()
+                contents = json.loads(contents) if is_json else contents.decode("utf-8")
+            except Exception:
                 os.remove(path)
             else:
-                print("Using cached result.")
+                print(status + "Using cached result.")
                 return contents
 
         try:
-            if (contents := (repo.get_readme() if filename == "README.md" else repo.get_contents(filename))):
+            if repo.repository is None:
+                repo.repository = gh.get_repo(repo.full_name)
+            if (contents := (repo.repository.get_readme() if filename == "README.md" else repo.repository.get_contents(filename))):
                 contents = contents.decoded_content.decode("utf-8")
             if is_json and isinstance(contents, str):
                 contents = json.loads(contents)
         except Exception as e:
-            print(e)
+            print(status + str(e))
             contents = {} if is_json else ""
         else:
-            print("Success!")
+            print(status + "Success!")
         finally:
             if allow_empty or contents:
-                path.parent.mkdir(parents=True, exist_ok=True)
-                with open(path, "w") as f:
-                    if is_json:
-                        json.dump(contents, f)
-                    else:
-                        f.write(contents)
+                write_file(path, (json.dumps(contents) if is_json else contents).encode("utf-8"))
         return contents
 
     # delete readme
@@ -84,102 +123,159 @@ def main(reset: bool = False):
     print("Connecting with GitHub Web API")
     gh = Github()
 
+    def get_repo(repo_slug: str) -> SimpleNamespace:
+        path = cache_dir / repo_slug / "repo.json"
+
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    attributes = json.loads(f.read())
+            except Exception:
+                os.remove(path)
+            else:
+                attributes["owner"] = SimpleNamespace(**attributes["owner"])
+                return SimpleNamespace(repository=None, **attributes)
+
+        # only keep the attributes used for markdown generation
+        repository = gh.get_repo(repo_slug)
+        attributes = {
+            "full_name": repository.full_name,
+            "name": repository.name,
+            "default_branch": repository.default_branch,
+            "description": repository.description,
+            "homepage": repository.homepage,
+            "html_url": repository.html_url,
+            "owner": {
+                "login": repository.owner.login,
+                "name": repository.owner.name,
+                "html_url": repository.owner.html_url,
+            },
+        }
+        write_file(path, json.dumps(attributes).encode("utf-8"))
+
+        attributes["owner"] = SimpleNamespace(**attributes["owner"])
+        return SimpleNamespace(repository=repository, **attributes)
+
+    def read_repository(repo_slug: str) -> dict|None:
+        # get repository
+        try:
+            repo = get_repo(repo_slug)
+        except Exception as e:
+            print("Reading repository - {:s}: {:s}".format(repo_slug, e.message if hasattr(e, "message") and e.message else str(e)))
+            print(f"Skipping repository - {repo_slug}")
+            return None
+        else:
+            print(f"Reading repository - {repo_slug}: Success!")
+        raw_url = "https://raw.githubusercontent.com/{:s}/{:s}".format(
+            repo.full_name,
+            repo.default_branch
+        )
+
+        # read repository readme (for title and screenshot)
+        readme_contents = read_file(repo, "README.md")
+        title = TITLE_PATTERN.search(readme_contents)
+        title = title.group(1) if title is not None else repo.name
+
+        # read Fruit Jam OS metadata
+        metadata = read_file(repo, "metadata.json")
+        if "title" in metadata:
+            title = metadata["title"]
+        icon = metadata["icon"] if "icon" in metadata else None
+
+        # read build metadata
+        build_metadata = read_file(repo, "build/metadata.json")
+        guide_url = build_metadata["guide_url"] if "guide_url" in build_metadata else None
+
+        # find screenshot in readme contents
+        screenshot = SCREENSHOT_PATTERN.search(readme_contents)
+
+        # create details table
+        details = {}
+        if repo.homepage:
+            details["Website"] = repo.homepage
+        if guide_url is not None:
+            details["Playground Guide"] = f"[{guide_url}]({guide_url})"
+        details["Latest Release"] = f"[Download]({repo.html_url}/releases/latest)"
+        details["Code Repository"] = f"[{repo.full_name}]({repo.html_url})"
+        details["Author"] = "[{:s}]({:s})".format(repo.owner.name if repo.owner.name is not None else repo.owner.login, repo.owner.html_url)
+
+        # details displayed by the library on device
+        application = {
+            "full_name": repo_slug,
+            "description": metadata["description"] if "description" in metadata else (repo.description or ""),
+            "default_branch": repo.default_branch,
+        }
+        if "title" in metadata:
+            application["title"] = metadata["title"]
+        if icon is not None:
+            application["icon"] = icon
+
+        return {
+            "application": application,
+            "title": title,
+            "icon": "{:s}/{:s}".format(raw_url, icon) if icon is not None else None,
+            "description": repo.description,
+            "screenshot": (screenshot.group(1), raw_url + "/" + screenshot.group(2)) if screenshot is not None else None,
+            "details": list(map(lambda key: f"{key}: {details[key]}", details)),
+        }
+
+    # read each repository once, concurrently, while keeping the database order for output
+    repo_slugs = list(dict.fromkeys(repo_slug for repositories in database.values() for repo_slug in repositories))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = dict(zip(repo_slugs, executor.map(read_repository, repo_slugs)))
+
+    # write compact database with prebuilt application details for devices to download and parse
+    # repositories which couldn't be read are left as names to be requested on device
+    minified_database = {
+        category: [results[repo_slug]["application"] if results[repo_slug] is not None else repo_slug for repo_slug in repositories]
+        for category, repositories in database.items()
+    }
+    print("Saving minified database into {:s}".format(MINIFIED_DATABASE_FILE))
+    with open(db_dir / MINIFIED_DATABASE_FILE, "w") as f:
+        if json.__name__ == "ujson":
+            json.dump(minified_database, f, escape_forward_slashes=False)  # already compact
+        else:
+            json.dump(minified_database, f, separators=(",", ":"))
+
     # setup README
     print("Beginning markdown file generation")
-    md = MdUtils(file_name=str(db_dir / MARKDOWN_FILE))
-    md.new_header(
-        level=1,
-        title="Applications Database",
-    )
-    md.new_line("Interested in contributing your Fruit Jam application? Read the [documention](./CONTRIBUTING.md) to learn more.")
-    md.new_line()
+    md = io.StringIO()
+    md.write("# Applications Database\n\n")
+    md.write("Interested in contributing your Fruit Jam application? Read the [documention](./CONTRIBUTING.md) to learn more.\n")
 
     for category in database.keys():
         repositories = database[category]
 
         print(f"Generating category: {category}")
-        md.new_header(
-            level=2,
-            title=category,
-        )
+        md.write(f"\n## {category}\n")
 
         for repo_slug in repositories:
-            # get repository
-            print(f"Reading repository - {repo_slug}: ", end="")
-            try:
-                repo = gh.get_repo(repo_slug)
-            except Exception as e:
-                if hasattr(e, "message") and e.message:
-                    print(e.message)
-                else:
-                    print(e)
-                print("Skipping repository")
+            if (result := results[repo_slug]) is None:
                 continue
-            else:
-                print("Success!")
-            raw_url = "https://raw.githubusercontent.com/{:s}/main".format(
-                repo.full_name,
-                repo.default_branch
-            )
-
-            # read repository readme (for title and screenshot)
-            readme_contents = read_file(repo, "README.md")
-            title = re.search(r'^# (.*)$', readme_contents, re.MULTILINE)
-            title = title.group(1) if title is not None else repo.name
-
-            # read Fruit Jam OS metadata
-            metadata = read_file(repo, "metadata.json")
-            if "title" in metadata:
-                title = metadata["title"]
-            icon = metadata["icon"] if "icon" in metadata else None
-
-            # read build metadata
-            build_metadata = read_file(repo, "build/metadata.json")
-            guide_url = build_metadata["guide_url"] if "guide_url" in build_metadata else None
-            
+            title = result["title"]
+
             # add application title
-            md.new_header(
-                level=3,
-                title=(
-                    "![{:s} icon]({:s}/{:s}) {:s}".format(
-                        title,
-                        raw_url,
-                        icon,
-                        title
-                    ) if icon is not None else title
-                ),
-            )
+            if result["icon"] is not None:
+                md.write("\n### ![{:s} icon]({:s}) {:s}\n".format(title, result["icon"], title))
+            else:
+                md.write(f"\n### {title}\n")
 
             # add project description
-            if repo.description:
-                md.new_line(repo.description)
-                md.new_line()
-
-            # find screenshot in readme contents
-            screenshot = re.search(r'!\[([^\]]*)\]\(([^\)]+)\)', readme_contents)
-            if screenshot is not None:
-                md.new_line(md.new_inline_image(
-                    text=screenshot.group(1),
-                    path=raw_url + "/" + screenshot.group(2),
-                ))
-                md.new_line()
-
-            # create details table
-            details = {}
-            if repo.homepage:
-                details["Website"] = repo.homepage
-            if guide_url is not None:
-                details["Playground Guide"] = f"[{guide_url}]({guide_url})"
-            details["Latest Release"] = f"[Download]({repo.html_url}/releases/latest)"
-            details["Code Repository"] = f"[{repo.full_name}]({repo.html_url})"
-            details["Author"] = "[{:s}]({:s})".format(repo.owner.name if repo.owner.name is not None else repo.owner.login, repo.owner.html_url)
-
-            details = list(map(lambda key: f"{key}: {details[key]}", details))
-            md.new_list(details)
-    
+            if result["description"]:
+                md.write(f"\n{result['description']}\n")
+
+            # add screenshot from readme contents
+            if result["screenshot"] is not None:
+                text, path = result["screenshot"]
+                md.write(f"\n![{text}]({path})\n")
+
+            # add details table
+            md.write("\n" + "".join(f"- {detail}\n" for detail in result["details"]))
+
     # save file
     print("Saving markdown into {:s}".format(MARKDOWN_FILE))
-    md.create_md_file()
+    with open(db_dir / MARKDOWN_FILE, "w") as f:
+        f.write(md.getvalue())
 
     # close connection to GitHub API
     print("Closing GitHub Web API connection")
@@ -190,6 +286,9 @@ def main(reset: bool = False):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('-r', '--reset', action='store_true')
+    parser.add_argument('-c', '--check', action='store_true')
     args = parser.parse_args()
 
+    if args.check:
+        sys.exit(0 if check() else 1)
     main(reset=args.reset)